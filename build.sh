@@ -0,0 +1,43 @@
+#!/bin/sh
+# Build optimized Beat to Music artifacts for the Raspberry Pi Pico:
+#   build/firmware.uf2    MicroPython compiled at -O2 with the app frozen in
+#   build/beat-to-music.zip  precompiled .mpy modules for a stock firmware
+#
+# Usage: ./build.sh /path/to/micropython
+set -e
+
+MPY_DIR=${1:?usage: $0 /path/to/micropython}
+BOARD=${BOARD:-RPI_PICO}
+HERE=$(cd "$(dirname "$0")" && pwd)
+BUILD="$HERE/build"
+DEPLOY="$BUILD/deploy"
+
+# Cross compiler for .mpy files
+make -C "$MPY_DIR/mpy-cross"
+MPY_CROSS="$MPY_DIR/mpy-cross/build/mpy-cross"
+
+# Firmware with the modules frozen in. rp2 builds with CMake, so the
+# optimization level goes through CMAKE_ARGS rather than CFLAGS_EXTRA; it is
+# passed in the environment so the Makefile can still append its own args.
+# CMake only configures a fresh build directory, so start from an empty one
+# of our own or a leftover configuration would silently drop the flags.
+FW_BUILD="$BUILD/firmware-$BOARD"
+rm -rf "$FW_BUILD"
+make -C "$MPY_DIR/ports/rp2" BOARD="$BOARD" BUILD="$FW_BUILD" submodules
+CMAKE_ARGS="-DCMAKE_BUILD_TYPE=Release -DCMAKE_C_FLAGS_RELEASE='-O2 -DNDEBUG'" \
+    make -C "$MPY_DIR/ports/rp2" BOARD="$BOARD" BUILD="$FW_BUILD" \
+    FROZEN_MANIFEST="$HERE/manifest.py"
+cp "$FW_BUILD/firmware.uf2" "$BUILD/"
+
+# Precompiled modules; the RP2040 is a Cortex-M0+ (armv6m), which the
+# viper code in pulse_sensor.py needs. main.py stays as source because
+# MicroPython only auto-runs main.py.
+rm -rf "$DEPLOY"
+mkdir -p "$DEPLOY"
+for module in display music_player pulse_sensor; do
+    "$MPY_CROSS" -O3 -march=armv6m -o "$DEPLOY/$module.mpy" "$HERE/$module.py"
+done
+cp "$HERE/main.py" "$DEPLOY/"
+(cd "$DEPLOY" && rm -f ../beat-to-music.zip && zip -q ../beat-to-music.zip *)
+
+echo "Built $BUILD/firmware.uf2 and $BUILD/beat-to-music.zip"
@@ -20,16 +20,35 @@ class SSD1306_I2C:
         self.addr = addr
         self.width = width
         self.height = height
+        self.pages = self.height // 8
         
-        self.buffer = bytearray(self.width * self.height // 8)
+        self.buffer = bytearray(self.width * self.pages)
         self.framebuf = framebuf.FrameBuffer(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
+        self._buf_mv = memoryview(self.buffer)
+        
+        # Preallocated data transfer buffer with leading 0x40 control byte
+        self._txbuf = bytearray(len(self.buffer) + 1)
+        self._txbuf[0] = 0x40
+        self._tx_mv = memoryview(self._txbuf)
+        
+        # Page range touched since the last flush (whole screen to start)
+        self.dirty_page_min = 0
+        self.dirty_page_max = self.pages - 1
+        
+        # Page window currently programmed into the controller
+        self.window_page_min = 0
+        self.window_page_max = self.pages - 1
+        
+        # Preallocated command stream for reprogramming the address window
+        self._window_cmd = bytearray([0x00, 0x22, 0, 0, 0x21, 0, self.width - 1])
         
         # Initialize display
         self.init_display()
         
     def init_display(self):
         """Initialize OLED display with proper commands"""
-        for cmd in [
+        self.write_cmds(bytes([
+            0x00,  # Control byte: command stream
             0xAE,  # Display off
             0x20, 0x00,  # Set Memory Addressing Mode
             0xB0,  # Set Page Start Address
@@ -48,55 +67,116 @@ class SSD1306_I2C:
             0xDA, 0x12,  # Set com pins hardware configuration
             0xDB, 0x20,  # Set vcomh
             0x8D, 0x14,  # Set DC-DC enable
+            0x21, 0x00, 0x7F,  # Set column address window
+            0x22, 0x00, 0x07,  # Set page address window
             0xAF  # Display on
-        ]:
-            self.write_cmd(cmd)
-            
+        ]))
+        
     def write_cmd(self, cmd):
         """Write command to display"""
         self.i2c.writeto(self.addr, bytes([0x80, cmd]))
         
+    def write_cmds(self, buf):
+        """Write a command stream (starting with control byte 0x00) in one transaction"""
+        self.i2c.writeto(self.addr, buf)
+        
     def write_data(self, buf):
         """Write data to display"""
-        self.i2c.writeto(self.addr, b'\x40' + buf)
+        n = len(buf)
+        self._tx_mv[1:n + 1] = buf
+        self.i2c.writeto(self.addr, self._tx_mv[:n + 1])
+        
+    def set_page_window(self, page_min, page_max):
+        """Restrict display RAM writes to a page range (full width)"""
+        if page_min == self.window_page_min and page_max == self.window_page_max:
+            return
+            
+        # Set page address (0x22) then column address (0x21)
+        self._window_cmd[2] = page_min
+        self._window_cmd[3] = page_max
+        self.write_cmds(self._window_cmd)
+        
+        self.window_page_min = page_min
+        self.window_page_max = page_max
+        
+    def mark_dirty(self, y, h):
+        """Extend dirty page range to cover rows y..y+h-1"""
+        if h <= 0:
+            return
+            
+        page_min = max(0, y >> 3)
+        page_max = min(self.pages - 1, (y + h - 1) >> 3)
+        
+        if page_min < self.dirty_page_min:
+            self.dirty_page_min = page_min
+        if page_max > self.dirty_page_max:
+            self.dirty_page_max = page_max
+            
+    def reset_dirty(self):
+        """Mark the whole buffer as flushed"""
+        self.dirty_page_min = self.pages
+        self.dirty_page_max = -1
         
     def show(self):
         """Update display with buffer contents"""
-        self.write_data(self.buffer)
+        self.set_page_window(0, self.pages - 1)
+        self._tx_mv[1:] = self.buffer
+        self.i2c.writeto(self.addr, self._txbuf)
+        self.reset_dirty()
+        
+    def fast_show(self):
+        """Update display with only the pages changed since the last flush"""
+        page_min = self.dirty_page_min
+        page_max = self.dirty_page_max
+        if page_min > page_max:
+            return
+            
+        self.set_page_window(page_min, page_max)
+        self.write_data(self._buf_mv[page_min * self.width:(page_max + 1) * self.width])
+        self.reset_dirty()
         
     def fill(self, col):
         """Fill entire display"""
         self.framebuf.fill(col)
+        self.mark_dirty(0, self.height)
         
     def pixel(self, x, y, col):
         """Set pixel"""
         self.framebuf.pixel(x, y, col)
+        self.mark_dirty(y, 1)
         
     def text(self, string, x, y, col=1):
         """Draw text"""
         self.framebuf.text(string, x, y, col)
+        self.mark_dirty(y, 8)
         
     def line(self, x1, y1, x2, y2, col):
         """Draw line"""
         self.framebuf.line(x1, y1, x2, y2, col)
+        if y1 < y2:
+            self.mark_dirty(y1, y2 - y1 + 1)
+        else:
+            self.mark_dirty(y2, y1 - y2 + 1)
         
     def rect(self, x, y, w, h, col):
         """Draw rectangle"""
         self.framebuf.rect(x, y, w, h, col)
+        self.mark_dirty(y, h)
         
     def fill_rect(self, x, y, w, h, col):
         """Draw filled rectangle"""
         self.framebuf.fill_rect(x, y, w, h, col)
+        self.mark_dirty(y, h)
 
 class HeartDisplay:
-    def __init__(self, sda_pin=0, scl_pin=1, freq=400000):
+    def __init__(self, sda_pin=0, scl_pin=1, freq=1_000_000):
         """
         Initialize heart rate display
         
         Args:
             sda_pin: I2C SDA pin (default GP0)
             scl_pin: I2C SCL pin (default GP1)
-            freq: I2C frequency
+            freq: I2C frequency (use 700000 if the bus is unreliable)
         """
         # Initialize I2C
         self.i2c = I2C(0, sda=Pin(sda_pin), scl=Pin(scl_pin), freq=freq)
@@ -108,16 +188,45 @@ class HeartDisplay:
         self.waveform_width = 128
         self.waveform_height = 32
         self.waveform_y_offset = 32
-        self.waveform_buffer = [32] * self.waveform_width  # Center line
-        self.waveform_index = 0
+        
+        # Framebuffer view over the waveform pages, scrolled one column per sample
+        band_start = self.waveform_y_offset // 8 * self.waveform_width
+        band_end = band_start + self.waveform_width * self.waveform_height // 8
+        self.waveform_fb = framebuf.FrameBuffer(
+            memoryview(self.display.buffer)[band_start:band_end],
+            self.waveform_width, self.waveform_height, framebuf.MONO_VLSB)
+        self._prev_y = 16  # Center line
+        self._waveform_stale = True  # A full-screen view drew over the strip
         
         # Heart animation
         self.heart_beat_time = 0
         self.heart_scale = 0
         
+        # Prerendered 8x8 heart tiles, one per scale (0-3), centred on (4, 4)
+        self._heart_frames = []
+        for scale in range(4):
+            size = 1 + scale
+            tile = framebuf.FrameBuffer(bytearray(8), 8, 8, framebuf.MONO_VLSB)
+            if size > 1:
+                # Heart shape approximation
+                tile.fill_rect(4 - size, 4, size * 2, size, 1)
+                tile.fill_rect(4 - size//2, 4 - size//2, size, size//2, 1)
+                tile.fill_rect(4, 4 - size//2, size, size//2, 1)
+            self._heart_frames.append(tile)
+        
         # Display update timing
         self.last_update_time = 0
         self.update_interval = 50  # 20 FPS
+        self.last_full_update_time = 0
+        self.full_update_interval = 500  # Redraw everything at least every 500 ms
+        self._dirty = True  # Text area needs redrawing
+        self._last_heart_scale = -1
+        
+        # Cached text, rebuilt only when the value changes
+        self._last_bpm = -1
+        self._last_sig = -1
+        self._bpm_text = "BPM: ---"
+        self._sig_text = "Sig: 0%"
         
         print("OLED Display initialized!")
         
@@ -128,6 +237,7 @@ class HeartDisplay:
         self.display.text("Heart Monitor", 15, 25, 1)
         self.display.text("Initializing...", 10, 45, 1)
         self.display.show()
+        self._waveform_stale = True
         
     def show_calibration_screen(self, progress=0):
         """Display calibration screen"""
@@ -142,34 +252,38 @@ class HeartDisplay:
         self.display.fill_rect(15, 51, bar_width, 6, 1)
         
         self.display.show()
+        self._waveform_stale = True
         
     def add_waveform_point(self, value):
-        """Add point to scrolling waveform"""
+        """Scroll waveform left and draw the new point in the last column"""
         # Normalize value to fit waveform area (0-32 pixels)
-        normalized = max(0, min(31, int(value / 2048)))  # Assuming 16-bit ADC
-        
-        self.waveform_buffer[self.waveform_index] = normalized
-        self.waveform_index = (self.waveform_index + 1) % self.waveform_width
-        
-    def draw_waveform(self):
-        """Draw scrolling waveform"""
-        # Clear waveform area
-        self.display.fill_rect(0, self.waveform_y_offset, 128, self.waveform_height, 0)
-        
-        # Draw waveform
-        for i in range(self.waveform_width - 1):
-            x1 = i
-            y1 = self.waveform_y_offset + (31 - self.waveform_buffer[i])
-            x2 = i + 1
-            y2 = self.waveform_y_offset + (31 - self.waveform_buffer[(i + 1) % self.waveform_width])
-            
-            self.display.line(x1, y1, x2, y2, 1)
+        normalized = value >> 11  # Assuming 16-bit ADC (value / 2048)
+        if normalized > 31:
+            normalized = 31
+        y = 31 - normalized
+        
+        fb = self.waveform_fb
+        x = self.waveform_width - 1
+        prev_y = self._prev_y
+        
+        # Shift existing pixels instead of redrawing the whole trace
+        fb.scroll(-1, 0)
+        fb.vline(x, 0, self.waveform_height, 0)
+        
+        # Vertical segment joining the previous point to this one
+        if y < prev_y:
+            fb.vline(x, y, prev_y - y + 1, 1)
+        else:
+            fb.vline(x, prev_y, y - prev_y + 1, 1)
             
-        # Draw center reference line
-        self.display.line(0, self.waveform_y_offset + 16, 127, self.waveform_y_offset + 16, 1)
+        # Center reference line
+        fb.pixel(x, 16, 1)
         
-    def draw_heart_icon(self, beat_detected=False):
-        """Draw animated heart icon"""
+        self._prev_y = y
+        self.display.mark_dirty(self.waveform_y_offset, self.waveform_height)
+        
+    def update_heart_scale(self, beat_detected=False):
+        """Advance heart animation"""
         current_time = utime.ticks_ms()
         
         if beat_detected:
@@ -183,15 +297,14 @@ class HeartDisplay:
             else:
                 self.heart_scale = 0
                 
-        # Draw simple heart (two circles and triangle)
+    def draw_heart_icon(self):
+        """Draw animated heart icon"""
+        # Blit the prerendered tile for this scale (transparent background)
         heart_x, heart_y = 105, 8
-        size = 1 + self.heart_scale
         
-        if size > 1:
-            # Heart shape approximation
-            self.display.fill_rect(heart_x - size, heart_y, size * 2, size, 1)
-            self.display.fill_rect(heart_x - size//2, heart_y - size//2, size, size//2, 1)
-            self.display.fill_rect(heart_x, heart_y - size//2, size, size//2, 1)
+        if self.heart_scale > 0:
+            self.display.framebuf.blit(self._heart_frames[self.heart_scale], heart_x - 4, heart_y - 4, 0)
+            self.display.mark_dirty(heart_y - 4, 8)
             
     def update_display(self, bpm, signal_strength, beat_detected, raw_value):
         """Update full display"""
@@ -201,39 +314,66 @@ class HeartDisplay:
         if utime.ticks_diff(current_time, self.last_update_time) < self.update_interval:
             return
             
-        self.display.fill(0)
-        
+        # Wipe whatever a full-screen view left in the waveform strip; the
+        # text area was overwritten too, so redraw it as well
+        if self._waveform_stale:
+            self.waveform_fb.fill(0)
+            self._prev_y = 16
+            self._waveform_stale = False
+            self._dirty = True
+            
         # Add waveform point
         self.add_waveform_point(raw_value)
         
-        # Draw waveform
-        self.draw_waveform()
+        # Only redraw the text area when something shown there changed (or
+        # for the periodic full refresh); otherwise flush just the waveform
+        self.update_heart_scale(beat_detected)
+        if (bpm != self._last_bpm or signal_strength != self._last_sig or
+                self.heart_scale != self._last_heart_scale):
+            self._dirty = True
+            
+        if (not self._dirty and
+                utime.ticks_diff(current_time, self.last_full_update_time) < self.full_update_interval):
+            self.display.fast_show()
+            self.last_update_time = current_time
+            return
+            
+        # Clear text area; the waveform area keeps its scrolled contents
+        self.display.fill_rect(0, 0, 128, self.waveform_y_offset, 0)
         
         # Display BPM
-        bpm_text = f"BPM: {bpm:3d}" if bpm > 0 else "BPM: ---"
-        self.display.text(bpm_text, 5, 5, 1)
+        if bpm != self._last_bpm:
+            self._bpm_text = "BPM: %3d" % bpm if bpm > 0 else "BPM: ---"
+            self._last_bpm = bpm
+        self.display.text(self._bpm_text, 5, 5, 1)
         
         # Display signal strength
-        signal_text = f"Sig: {signal_strength}%"
-        self.display.text(signal_text, 5, 15, 1)
+        if signal_strength != self._last_sig:
+            self._sig_text = "Sig: %d%%" % signal_strength
+            self._last_sig = signal_strength
+        self.display.text(self._sig_text, 5, 15, 1)
         
         # Draw heart icon
-        self.draw_heart_icon(beat_detected)
+        self.draw_heart_icon()
+        self._last_heart_scale = self.heart_scale
         
         # Status indicators
         if signal_strength < 30:
-            self.display.text("Check sensor!", 5, 55, 1)
+            self.display.text("Check sensor!", 5, 24, 1)
         elif bpm > 100:
             self.display.text("Fast!", 80, 5, 1)
         elif bpm < 60 and bpm > 0:
             self.display.text("Calm", 80, 5, 1)
             
-        self.display.show()
+        self.display.fast_show()
+        self._dirty = False
         self.last_update_time = current_time
+        self.last_full_update_time = current_time
         
     def show_error(self, message):
         """Display error message"""
         self.display.fill(0)
         self.display.text("ERROR:", 30, 20, 1)
         self.display.text(message, 10, 35, 1)
-        self.display.show()
\ No newline at end of file
+        self.display.show()
+        self._waveform_stale = True
\ No newline at end of file
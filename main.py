@@ -82,17 +82,29 @@ class BeatToMusicApp:
         calibration_start = utime.ticks_ms()
         calibration_duration = 3000  # 3 seconds
         
+        last_step = -1
+        next_sound = 25  # Beep at 25%, 50% and 75%
+        
         while utime.ticks_diff(utime.ticks_ms(), calibration_start) < calibration_duration:
-            elapsed = utime.ticks_diff(utime.ticks_ms(), calibration_start)
+            now = utime.ticks_ms()
+            elapsed = utime.ticks_diff(now, calibration_start)
             progress = (elapsed * 100) // calibration_duration
             
-            self.display.show_calibration_screen(progress)
-            
-            if progress == 25 or progress == 50 or progress == 75:
+            # Redraw only when the progress bar moves (5% steps)
+            step = progress // 5
+            if step != last_step:
+                self.display.show_calibration_screen(step * 5)
+                last_step = step
+                
+            if progress >= next_sound and next_sound < 100:
                 self.music_player.play_calibration_sound()
+                next_sound += 25
                 
-            utime.sleep_ms(50)
+            self.music_player.poll(now)
+            utime.sleep_ms(10)
             
+        self.music_player.wait()
+        
         # Perform sensor calibration
         self.pulse_sensor.calibrate()
         
@@ -104,35 +116,61 @@ class BeatToMusicApp:
         print("Starting main loop...")
         self.running = True
         
+        # The loop body allocates very little in steady state, so instead of
+        # collecting periodically, start from a clean heap and let the
+        # allocator collect only after a quarter of the free heap is used
+        gc.collect()
+        gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
+        
+        # Bind hot-path methods to locals to skip attribute lookups per iteration
+        ticks_ms = utime.ticks_ms
+        ticks_diff = utime.ticks_diff
+        ticks_add = utime.ticks_add
+        sleep_ms = utime.sleep_ms
+        detect_beat = self.pulse_sensor.detect_beat
+        get_signal_strength = self.pulse_sensor.get_signal_strength
+        handle_beat_detected = self.handle_beat_detected
+        set_mode_by_bpm = self.music_player.set_mode_by_bpm
+        poll_music = self.music_player.poll
+        update_display = self.display.update_display
+        monitor_performance = self.monitor_performance
+        
+        # Deadline-based pacing at ~50Hz
+        loop_period = 20  # ms
+        next_deadline = ticks_ms()
+        
         while self.running:
             try:
-                loop_start = utime.ticks_ms()
+                loop_start = ticks_ms()
+                
+                # Advance queued tones without blocking
+                poll_music(loop_start)
                 
                 # Read pulse sensor
-                beat_detected, raw_value, filtered_value, bpm = self.pulse_sensor.detect_beat()
+                beat_detected, raw_value, filtered_value, bpm = detect_beat()
                 
                 # Handle beat detection
                 if beat_detected:
-                    self.handle_beat_detected(bpm)
+                    handle_beat_detected(bpm)
                     
                 # Update music mode based on BPM
-                self.music_player.set_mode_by_bpm(bpm)
+                set_mode_by_bpm(bpm)
                 
                 # Update display
-                signal_strength = self.pulse_sensor.get_signal_strength()
-                self.display.update_display(bpm, signal_strength, beat_detected, raw_value)
+                signal_strength = get_signal_strength()
+                update_display(bpm, signal_strength, beat_detected, raw_value)
                 
                 # Performance monitoring
-                self.monitor_performance()
+                monitor_performance()
                 
-                # Small delay for stability (adjust based on performance needs)
-                loop_time = utime.ticks_diff(utime.ticks_ms(), loop_start)
-                if loop_time < 20:  # Target ~50Hz update rate
-                    utime.sleep_ms(20 - loop_time)
-                    
-                # Garbage collection periodically
-                if self.loop_count % 100 == 0:
-                    gc.collect()
+                # Sleep until the next slot; after an overrun, drop the
+                # missed slots and resync instead of running back-to-back
+                next_deadline = ticks_add(next_deadline, loop_period)
+                delay = ticks_diff(next_deadline, ticks_ms())
+                if delay > 0:
+                    sleep_ms(delay)
+                else:
+                    next_deadline = ticks_ms()
                     
                 self.loop_count += 1
                 
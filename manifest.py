@@ -0,0 +1,8 @@
+# Freeze Beat to Music into the MicroPython firmware image, e.g.
+#   make -C ports/rp2 BOARD=RPI_PICO FROZEN_MANIFEST=/path/to/manifest.py
+include("$(PORT_DIR)/boards/manifest.py")
+
+module("display.py", opt=3)
+module("music_player.py", opt=3)
+module("pulse_sensor.py", opt=3)
+module("main.py", opt=3)
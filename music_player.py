@@ -8,8 +8,20 @@ Wiring:
 """
 
 from machine import Pin, PWM
+import array
 import utime
 
+# Musical note frequencies in Hz, indexed by note number:
+#  0 C4   1 D4   2 E4   3 F4   4 G4   5 A4   6 B4
+#  7 C5   8 D5   9 E5  10 F5  11 G5  12 A5  13 B5
+# 14 C6  15 D6  16 E6
+# (tuple literal so a frozen build keeps it in flash)
+NOTE_FREQS = (
+    262, 294, 330, 349, 392, 440, 494,
+    523, 587, 659, 698, 784, 880, 988,
+    1047, 1175, 1319
+)
+
 class MusicPlayer:
     def __init__(self, buzzer_pin=15):
         """
@@ -22,17 +34,10 @@ class MusicPlayer:
         self.buzzer = PWM(Pin(buzzer_pin))
         self.buzzer.duty_u16(0)  # Start silent
         
-        # Musical notes (frequencies in Hz)
-        self.notes = {
-            'C4': 262, 'D4': 294, 'E4': 330, 'F4': 349, 'G4': 392, 'A4': 440, 'B4': 494,
-            'C5': 523, 'D5': 587, 'E5': 659, 'F5': 698, 'G5': 784, 'A5': 880, 'B5': 988,
-            'C6': 1047, 'D6': 1175, 'E6': 1319
-        }
-        
-        # Melody patterns
-        self.calm_melody = ['C4', 'E4', 'G4', 'C5']
-        self.normal_melody = ['C4', 'D4', 'E4', 'F4', 'G4', 'A4', 'B4', 'C5']
-        self.fast_melody = ['C5', 'E5', 'G5', 'C6', 'G5', 'E5']
+        # Melody patterns (note numbers into NOTE_FREQS, as bytes literals)
+        self.calm_melody = b'\x00\x02\x04\x07'  # C4 E4 G4 C5
+        self.normal_melody = b'\x00\x01\x02\x03\x04\x05\x06\x07'  # C4 D4 E4 F4 G4 A4 B4 C5
+        self.fast_melody = b'\x07\x09\x0b\x0e\x0b\x09'  # C5 E5 G5 C6 G5 E5
         
         self.current_melody = self.normal_melody
         self.melody_index = 0
@@ -42,6 +47,15 @@ class MusicPlayer:
         self.melody_note_duration = 200  # ms
         self.last_sound_time = 0
         
+        # Tone queue (ring of frequency/duration pairs, frequency 0 = rest)
+        self.queue_size = 16
+        self._queue_freq = array.array('H', [0] * self.queue_size)
+        self._queue_duration = array.array('H', [0] * self.queue_size)
+        self._queue_head = 0
+        self._queue_len = 0
+        self._tone_active = False
+        self._tone_end = 0
+        
     def set_mode_by_bpm(self, bpm):
         """Set musical mode based on BPM"""
         if bpm < 60:
@@ -61,7 +75,7 @@ class MusicPlayer:
         
         # Play a quick chirp
         self.play_tone(base_freq, 50)
-        utime.sleep_ms(20)
+        self.play_tone(0, 20)
         self.play_tone(int(base_freq * 1.2), 30)
         
     def play_melody_note(self, bpm=70):
@@ -69,8 +83,11 @@ class MusicPlayer:
         if len(self.current_melody) == 0:
             return
             
-        note = self.current_melody[self.melody_index]
-        freq = self.notes[note]
+        # Melody may have switched to a shorter pattern since the last note
+        if self.melody_index >= len(self.current_melody):
+            self.melody_index = 0
+            
+        freq = NOTE_FREQS[self.current_melody[self.melody_index]]
         
         # Modify frequency slightly based on BPM
         freq_modifier = 1.0 + (bpm - 70) / 200.0  # Subtle pitch change
@@ -81,29 +98,69 @@ class MusicPlayer:
         self.melody_index = (self.melody_index + 1) % len(self.current_melody)
         
     def play_tone(self, frequency, duration_ms):
-        """Play a single tone"""
+        """Queue a single tone without blocking (frequency 0 queues a rest)"""
+        if self._queue_len >= self.queue_size:
+            return False  # Queue full, drop the tone
+            
+        index = (self._queue_head + self._queue_len) % self.queue_size
+        self._queue_freq[index] = frequency
+        self._queue_duration[index] = duration_ms
+        self._queue_len += 1
+        
+        if not self._tone_active:
+            self.poll(utime.ticks_ms())
+        return True
+        
+    def start_tone(self, frequency, duration_ms, now_ms):
+        """Start a tone immediately; poll() turns it off when it expires"""
         if frequency > 0:
             self.buzzer.freq(frequency)
             self.buzzer.duty_u16(32767)  # 50% duty cycle
-            utime.sleep_ms(duration_ms)
-        
-        self.buzzer.duty_u16(0)  # Turn off
-        
+        else:
+            self.buzzer.duty_u16(0)
+            
+        self._tone_end = utime.ticks_add(now_ms, duration_ms)
+        self._tone_active = True
+        
+    def poll(self, now_ms):
+        """Stop expired tones and start the next queued one"""
+        if self._tone_active:
+            if utime.ticks_diff(now_ms, self._tone_end) < 0:
+                return
+                
+            self._tone_active = False
+            self.buzzer.duty_u16(0)  # Turn off
+            
+        if self._queue_len > 0:
+            index = self._queue_head
+            self._queue_head = (index + 1) % self.queue_size
+            self._queue_len -= 1
+            self.start_tone(self._queue_freq[index], self._queue_duration[index], now_ms)
+            
+    def wait(self):
+        """Block until all queued tones have played"""
+        while self._tone_active or self._queue_len > 0:
+            utime.sleep_ms(5)
+            self.poll(utime.ticks_ms())
+            
     def play_startup_sound(self):
         """Play startup melody"""
-        startup_notes = ['C4', 'E4', 'G4', 'C5', 'G4', 'C5']
+        startup_notes = b'\x00\x02\x04\x07\x04\x07'  # C4 E4 G4 C5 G4 C5
         for note in startup_notes:
-            self.play_tone(self.notes[note], 150)
-            utime.sleep_ms(50)
+            self.play_tone(NOTE_FREQS[note], 150)
+            self.play_tone(0, 50)
+        self.wait()
             
     def play_calibration_sound(self):
-        """Play sound during calibration"""
+        """Queue sound during calibration (played by poll())"""
         for i in range(3):
             self.play_tone(440, 100)  # A4
-            utime.sleep_ms(100)
+            self.play_tone(0, 100)
             
     def silence(self):
-        """Turn off buzzer"""
+        """Turn off buzzer and drop queued tones"""
+        self._queue_len = 0
+        self._tone_active = False
         self.buzzer.duty_u16(0)
         
     def play_ambient_rhythm(self, bpm):
@@ -9,8 +9,51 @@ Wiring:
 """
 
 from machine import Pin, ADC
+from micropython import const
+import array
+import micropython
+import sys
 import utime
 
+try:
+    import rp2
+    from machine import mem32
+except ImportError:
+    rp2 = None
+
+# RP2040 ADC registers for free-running capture into the FIFO
+_ADC_CS = const(0x4004C000)
+_ADC_FCS = const(0x4004C008)
+_ADC_FIFO = const(0x4004C00C)
+_ADC_DIV = const(0x4004C010)
+_ADC_CS_EN = const(0x01)
+_ADC_CS_START_MANY = const(0x08)
+_ADC_FCS_EN = const(0x01)
+_ADC_FCS_DREQ_EN = const(0x08)
+_ADC_FCS_EMPTY = const(0x100)
+_DREQ_ADC = const(36)
+
+# Samples per DMA burst; the sum of 16 12-bit samples spans the 16-bit range
+_ADC_BURST = const(16)
+_ADC_SAMPLE_RATE = const(10000)  # Hz
+
+@micropython.viper
+def _sum16(buf, count: int) -> int:
+    """Sum the first count entries of a 16-bit sample buffer"""
+    samples = ptr16(buf)
+    total = 0
+    for i in range(count):
+        total += samples[i]
+    return total
+
+@micropython.viper
+def _ring_push(buf, index: int, sample: int) -> int:
+    """Store sample in a 16-bit ring buffer and return the value it replaced"""
+    readings = ptr16(buf)
+    old = readings[index]
+    readings[index] = sample
+    return old
+
 class PulseSensor:
     def __init__(self, adc_pin=26, threshold_factor=0.6, min_beat_interval=300):
         """
@@ -22,13 +65,24 @@ class PulseSensor:
             min_beat_interval: Minimum ms between beats (prevents false triggers)
         """
         self.adc = ADC(Pin(adc_pin))
+        
+        # Burst sampling through the ADC FIFO and DMA on the RP2040, single
+        # reads elsewhere (the register addresses below are RP2040-specific)
+        self._adc_buf = bytearray(_ADC_BURST * 2)
+        self._dma = None
+        if (rp2 is not None and hasattr(rp2, 'DMA') and
+                'RP2040' in sys.implementation._machine):
+            self._setup_dma(adc_pin - 26)
+            
         self.threshold_factor = threshold_factor
+        self._threshold_q8 = int(threshold_factor * 256)  # Fixed-point copy for the hot path
         self.min_beat_interval = min_beat_interval
         
         # Filter variables
         self.filter_size = 10
-        self.readings = [0] * self.filter_size
+        self.readings = array.array('H', [0] * self.filter_size)
         self.reading_index = 0
+        self._sum = 0
         self.filtered_value = 0
         
         # Beat detection variables
@@ -38,16 +92,52 @@ class PulseSensor:
         self.beat_detected = False
         self.peak_value = 0
         self.valley_value = 65535
+        self.decay_shift = 10  # Peak/valley relax 1/1024 of the gap per sample
         
         # BPM calculation
-        self.beat_intervals = []
         self.max_intervals = 5  # Average over last 5 beats
+        self._bi = array.array('I', [0] * self.max_intervals)
+        self._bi_count = 0
+        self._bi_idx = 0
+        self._bi_sum = 0
         self.current_bpm = 0
         
         # Calibration
         self.calibration_samples = 100
         self.calibrated = False
         
+    def _setup_dma(self, channel):
+        """Run the ADC free-running into its FIFO and drain it with DMA"""
+        mem32[_ADC_DIV] = (48_000_000 // _ADC_SAMPLE_RATE - 1) << 8
+        mem32[_ADC_FCS] = _ADC_FCS_EN | _ADC_FCS_DREQ_EN | (1 << 24)  # DREQ at 1 sample
+        mem32[_ADC_CS] = _ADC_CS_EN | _ADC_CS_START_MANY | (channel << 12)
+        
+        self._dma = rp2.DMA()
+        self._dma_ctrl = self._dma.pack_ctrl(size=1, inc_read=False, inc_write=True,
+                                             treq_sel=_DREQ_ADC)
+        self._start_burst()
+        
+    def _start_burst(self):
+        """Start DMA capture of the next burst of ADC samples"""
+        # Drop samples that queued up in the FIFO since the last burst
+        while not mem32[_ADC_FCS] & _ADC_FCS_EMPTY:
+            mem32[_ADC_FIFO]
+            
+        self._dma.config(read=_ADC_FIFO, write=self._adc_buf, count=_ADC_BURST,
+                         ctrl=self._dma_ctrl, trigger=True)
+        
+    def read_raw(self):
+        """Read a 16-bit ADC value, oversampled when DMA capture is available"""
+        if self._dma is None:
+            return self.adc.read_u16()
+            
+        while self._dma.active():
+            pass
+            
+        value = _sum16(self._adc_buf, _ADC_BURST)
+        self._start_burst()
+        return value
+        
     def calibrate(self):
         """Calibrate sensor by reading baseline values"""
         print("Calibrating pulse sensor... Keep finger steady!")
@@ -56,7 +146,7 @@ class PulseSensor:
         max_val = 0
         
         for i in range(self.calibration_samples):
-            raw = self.adc.read_u16()
+            raw = self.read_raw()
             min_val = min(min_val, raw)
             max_val = max(max_val, raw)
             utime.sleep_ms(10)
@@ -72,14 +162,15 @@ class PulseSensor:
     def read_filtered(self):
         """Read ADC with moving average filter"""
         # Get raw reading
-        raw_reading = self.adc.read_u16()
+        raw_reading = self.read_raw()
         
-        # Update circular buffer
-        self.readings[self.reading_index] = raw_reading
+        # Update circular buffer and running sum
+        old = _ring_push(self.readings, self.reading_index, raw_reading)
+        self._sum += raw_reading - old
         self.reading_index = (self.reading_index + 1) % self.filter_size
         
         # Calculate moving average
-        self.filtered_value = sum(self.readings) // self.filter_size
+        self.filtered_value = self._sum // self.filter_size
         
         return raw_reading, self.filtered_value
         
@@ -91,21 +182,38 @@ class PulseSensor:
         raw_val, filtered_val = self.read_filtered()
         current_time = utime.ticks_ms()
         
-        # Update peak and valley for dynamic threshold
-        if filtered_val > self.peak_value:
-            self.peak_value = filtered_val
-        if filtered_val < self.valley_value:
-            self.valley_value = filtered_val
+        # Work on locals, write back once below
+        peak = self.peak_value
+        valley = self.valley_value
+        threshold = self.threshold
+        decay_shift = self.decay_shift
+        
+        # Update peak and valley for dynamic threshold, decaying both towards
+        # the signal so the range recovers after motion artifacts. The shift
+        # truncates to zero once the gap is below 1 << decay_shift, so they
+        # settle no closer than ~1023 counts to the signal with the default 10
+        if filtered_val > peak:
+            peak = filtered_val
+        else:
+            peak -= (peak - filtered_val) >> decay_shift
+        if filtered_val < valley:
+            valley = filtered_val
+        else:
+            valley += (filtered_val - valley) >> decay_shift
             
         # Dynamic threshold adjustment
-        signal_range = self.peak_value - self.valley_value
+        signal_range = peak - valley
         if signal_range > 1000:  # Only adjust if we have significant signal
-            self.threshold = self.valley_value + int(signal_range * self.threshold_factor)
+            threshold = valley + (signal_range * self._threshold_q8 >> 8)
+            
+        self.peak_value = peak
+        self.valley_value = valley
+        self.threshold = threshold
         
         beat_detected = False
         
         # Beat detection: rising edge crossing threshold
-        if (filtered_val > self.threshold and 
+        if (filtered_val > threshold and 
             not self.beat_detected and 
             utime.ticks_diff(current_time, self.last_beat_time) > self.min_beat_interval):
             
@@ -115,21 +223,23 @@ class PulseSensor:
             # Calculate BPM
             if self.last_beat_time > 0:
                 interval = utime.ticks_diff(current_time, self.last_beat_time)
-                self.beat_intervals.append(interval)
                 
-                # Keep only recent intervals
-                if len(self.beat_intervals) > self.max_intervals:
-                    self.beat_intervals.pop(0)
+                # Overwrite oldest interval in the ring, keeping a running sum
+                old = self._bi[self._bi_idx]
+                self._bi_sum += interval - old
+                self._bi[self._bi_idx] = interval
+                self._bi_idx = (self._bi_idx + 1) % self.max_intervals
+                if self._bi_count < self.max_intervals:
+                    self._bi_count += 1
                     
                 # Calculate average BPM
-                if len(self.beat_intervals) >= 2:
-                    avg_interval = sum(self.beat_intervals) / len(self.beat_intervals)
-                    self.current_bpm = int(60000 / avg_interval)  # Convert ms to BPM
+                if self._bi_count >= 2:
+                    self.current_bpm = 60000 * self._bi_count // self._bi_sum  # Convert ms to BPM
                     
             self.last_beat_time = current_time
             
         # Reset beat flag when signal falls below threshold
-        elif filtered_val < self.threshold * 0.9:  # Hysteresis to prevent bouncing
+        elif filtered_val * 10 < threshold * 9:  # Hysteresis to prevent bouncing
             self.beat_detected = False
             
         return beat_detected, raw_val, filtered_val, self.current_bpm